@@ -0,0 +1,123 @@
+import os
+import random
+import time
+
+import pygame
+
+from neonstriker import AI_MAX_ENEMIES, Enemy, ParallelEnemyAI, Wall
+
+# ======================================
+# ENEMY AI BENCHMARK
+# Single-process Enemy.update vs ParallelEnemyAI, per swarm size
+# ======================================
+WIDTH, HEIGHT = 1920, 1080
+TICKS = 60
+COUNTS = [100, 250, 500, 1000, 2000, 4000, 8000]
+P_POS = pygame.Vector2(WIDTH // 2, HEIGHT // 2)
+P_RECT = pygame.Rect(0, 0, 40, 60)
+P_RECT.center = P_POS
+
+
+def build_scene(count, ai=None, seed=1):
+    random.seed(seed)
+    walls = pygame.sprite.Group(Wall(random.randint(100, WIDTH - 100), random.randint(220, HEIGHT - 100))
+                                for _ in range(16))
+    enemies = pygame.sprite.Group()
+    for _ in range(count):
+        e = Enemy(random.randint(50, WIDTH - 50), random.randint(170, HEIGHT - 50), random.random() < 0.5)
+        if ai: ai.attach(e)
+        enemies.add(e)
+    cull(enemies)
+    return enemies, walls
+
+
+def cull(enemies):
+    # Enemies touching the player die on contact, as in Game.update
+    for e in [e for e in enemies if e.rect.colliderect(P_RECT)]: e.kill()
+
+
+def time_ticks(step, enemies, walls):
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        step(enemies, P_POS, walls)
+        cull(enemies)
+    return (time.perf_counter() - start) / TICKS * 1000
+
+
+def check_parity(ai, count=2000, ticks=100):
+    # Both paths start every tick from the same positions; plain moves must match exactly
+    # and wall hits (random bounce direction) must be detected on the same enemies.
+    serial, walls = build_scene(count)
+    pooled, _ = build_scene(count, ai)
+    ai.load_walls(walls)
+    pairs = list(zip(serial.sprites(), pooled.sprites()))
+    mismatches = 0
+    for _ in range(ticks):
+        for s, p in pairs:
+            p.pos = s.pos
+            p.rect.center = p.pos
+        before = [pygame.Vector2(s.pos) for s, _ in pairs]
+        serial.update(P_POS, walls)
+        ai.update(pooled, P_POS, walls)
+        for (s, p), b in zip(pairs, before):
+            s_bounced = s.pos.distance_to(b) > s.speed + 1e-6
+            p_bounced = p.pos.distance_to(b) > p.speed + 1e-6
+            if s_bounced != p_bounced or (not s_bounced and s.pos.distance_to(p.pos) > 1e-9): mismatches += 1
+        alive = []
+        for s, p in pairs:
+            if s.rect.colliderect(P_RECT) or p.rect.colliderect(P_RECT):
+                s.kill()
+                p.kill()
+            else:
+                alive.append((s, p))
+        pairs = alive
+    ai.reset()
+    return mismatches
+
+
+def main():
+    workers = int(os.environ.get("NEONSTRIKER_AI_WORKERS", "0")) or os.cpu_count() or 1
+    ai = ParallelEnemyAI(workers)
+    crossover = None
+
+    def serial(enemies, p_pos, walls):
+        enemies.update(p_pos, walls)
+
+    def parallel(enemies, p_pos, walls):
+        ai.update(enemies, p_pos, walls)
+
+    # Force the pool path for every size so the raw crossover is visible
+    ai.min_enemies = 0
+
+    try:
+        mismatches = check_parity(ai)
+        print(f"Parity check: {'OK' if mismatches == 0 else f'{mismatches} mismatched enemy ticks'}")
+
+        print(f"{TICKS} ticks per run, {workers} worker(s)")
+        print(f"{'enemies':>8} {'serial ms':>10} {'parallel ms':>12} {'speedup':>8}")
+        for count in [c for c in COUNTS if c <= AI_MAX_ENEMIES]:
+            try:
+                enemies, walls = build_scene(count)
+                t_serial = time_ticks(serial, enemies, walls)
+                enemies, walls = build_scene(count, ai)
+                ai.load_walls(walls)
+                t_parallel = time_ticks(parallel, enemies, walls)
+            except Exception as exc:
+                print(f"{count:>8} failed: {exc}")
+                continue
+            finally:
+                ai.reset()
+            speedup = t_serial / t_parallel
+            if crossover is None and speedup > 1: crossover = count
+            print(f"{count:>8} {t_serial:>10.3f} {t_parallel:>12.3f} {speedup:>7.2f}x")
+    finally:
+        ai.close()
+
+    if crossover:
+        print(f"Parallel AI wins from ~{crossover} enemies (set NEONSTRIKER_AI_PARALLEL_MIN accordingly)")
+    else:
+        print("Parallel AI never beat single-process on this machine")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,9 @@ import pygame
 import random
 import math
 import array
+import heapq
 import os
+from multiprocessing import Pool, shared_memory
 
 # ======================================
 # PATH FIX (For Launcher Compatibility)
@@ -20,6 +22,11 @@ WHITE, GREEN, YELLOW, ORANGE, BLACK, RED, GRAY, CYAN = ((255, 255, 255), (0, 255
 HEADER_HEIGHT = 120
 MENU, PLAYING, PAUSED, DYING, GAMEOVER, TRANSITION = 0, 1, 2, 3, 4, 5
 
+# Parallel Enemy AI (0 workers = single-process update)
+AI_WORKERS = int(os.environ.get("NEONSTRIKER_AI_WORKERS", "0"))
+AI_PARALLEL_MIN = max(1, int(os.environ.get("NEONSTRIKER_AI_PARALLEL_MIN", "500")))
+AI_MAX_ENEMIES, AI_MAX_WALLS = 8192, 32
+
 
 def get_angle(origin, target):
     dx, dy = target[0] - origin[0], target[1] - origin[1]
@@ -86,9 +93,159 @@ class Item(pygame.sprite.Sprite):
         self.rect.y += math.sin(self.timer) * 0.6
 
 
+# --- Parallel Enemy AI ---
+# Shared layout: enemy block holds x | y | speed | push | alive columns of AI_MAX_ENEMIES doubles each,
+# indexed by the slot an enemy keeps from spawn to kill. The wall block holds (left, top, width, height)
+# per wall and is read-only for the workers.
+AI_COLUMNS = 5
+_ai_shared = {}
+
+
+def _ai_worker_init(enemy_name, wall_name):
+    # Forked workers inherit the parent's random state; reseed so shards bounce independently
+    random.seed()
+    _ai_shared["enemy"] = shared_memory.SharedMemory(name=enemy_name)
+    _ai_shared["wall"] = shared_memory.SharedMemory(name=wall_name)
+    _ai_shared["e"] = _ai_shared["enemy"].buf.cast("d")
+    _ai_shared["w"] = _ai_shared["wall"].buf.cast("d")
+    _ai_shared["box"] = pygame.Rect(0, 0, 40, 40)
+    _ai_shared["walls"], _ai_shared["wall_version"] = [], -1
+
+
+def _ai_step_shard(job):
+    # Mirrors Enemy.update for live slots in [start, end); the 40x40 box and wall Rects
+    # give the same hits as spritecollideany
+    start, end, px, py, n_walls, wall_version = job
+    if _ai_shared["wall_version"] != wall_version:
+        w = _ai_shared["w"]
+        _ai_shared["walls"] = [pygame.Rect(*map(int, w[i * 4:i * 4 + 4].tolist())) for i in range(n_walls)]
+        _ai_shared["wall_version"] = wall_version
+    e, n, box, walls = _ai_shared["e"], AI_MAX_ENEMIES, _ai_shared["box"], _ai_shared["walls"]
+
+    xs, ys = e[start:end].tolist(), e[n + start:n + end].tolist()
+    speeds, pushes = e[2 * n + start:2 * n + end].tolist(), e[3 * n + start:3 * n + end].tolist()
+    alive = e[4 * n + start:4 * n + end].tolist()
+    for k in range(end - start):
+        if not alive[k]: continue
+        x, y = xs[k], ys[k]
+        dx, dy = px - x, py - y
+        dist = math.sqrt(dx * dx + dy * dy)
+        if dist == 0: continue
+        speed = speeds[k]
+        dx, dy = dx / dist, dy / dist
+        x, y = x + dx * speed, y + dy * speed
+
+        box.center = (x, y)
+        if box.collidelist(walls) != -1:
+            dev = math.radians(random.uniform(-20, 20))
+            cos_d, sin_d = math.cos(dev), math.sin(dev)
+            push = speed * pushes[k]
+            x += (-dx * cos_d + dy * sin_d) * push
+            y += (-dx * sin_d - dy * cos_d) * push
+        xs[k], ys[k] = x, y
+    e[start:end] = array.array('d', xs)
+    e[n + start:n + end] = array.array('d', ys)
+
+
+class ParallelEnemyAI:
+    def __init__(self, workers):
+        self.workers = workers
+        self.min_enemies = AI_PARALLEL_MIN
+        self.n_walls, self.wall_version = 0, 0
+        self.owners = [None] * AI_MAX_ENEMIES
+        self.free, self.high, self.count = [], 0, 0
+        self.enemy_shm = self.wall_shm = self.e = self.w = self.pool = None
+        try:
+            self.enemy_shm = shared_memory.SharedMemory(create=True, size=AI_MAX_ENEMIES * AI_COLUMNS * 8)
+            self.wall_shm = shared_memory.SharedMemory(create=True, size=AI_MAX_WALLS * 4 * 8)
+            self.e, self.w = self.enemy_shm.buf.cast("d"), self.wall_shm.buf.cast("d")
+            self.pool = Pool(workers, initializer=_ai_worker_init,
+                             initargs=(self.enemy_shm.name, self.wall_shm.name))
+        except BaseException:
+            self.close()
+            raise
+
+    def attach(self, enemy):
+        if self.free:
+            slot = heapq.heappop(self.free)
+        elif self.high < AI_MAX_ENEMIES:
+            slot, self.high = self.high, self.high + 1
+        else:
+            return
+        e, n = self.e, AI_MAX_ENEMIES
+        e[slot], e[n + slot] = enemy._pos.x, enemy._pos.y
+        e[2 * n + slot], e[3 * n + slot], e[4 * n + slot] = enemy.speed, (8 if enemy.wave else 15), 1
+        self.owners[slot] = enemy
+        enemy.ai, enemy.slot = self, slot
+        self.count += 1
+
+    def release(self, enemy):
+        slot = enemy.slot
+        enemy._pos = self.get_pos(slot)
+        self.e[4 * AI_MAX_ENEMIES + slot] = 0
+        self.owners[slot] = None
+        enemy.ai = None
+        self.count -= 1
+        if self.count == 0:
+            self.free, self.high = [], 0
+        else:
+            heapq.heappush(self.free, slot)
+
+    def reset(self):
+        # Group.empty() and reset_game drop enemies without kill(), so detach them all at once
+        for slot, en in enumerate(self.owners[:self.high]):
+            if en: en._pos, en.ai = self.get_pos(slot), None
+        self.owners = [None] * AI_MAX_ENEMIES
+        self.free, self.high, self.count = [], 0, 0
+
+    def get_pos(self, slot):
+        return pygame.Vector2(self.e[slot], self.e[AI_MAX_ENEMIES + slot])
+
+    def set_pos(self, slot, pos):
+        self.e[slot], self.e[AI_MAX_ENEMIES + slot] = pos.x, pos.y
+
+    def load_walls(self, walls):
+        rects = [w.rect for w in walls][:AI_MAX_WALLS]
+        for i, r in enumerate(rects):
+            self.w[i * 4:i * 4 + 4] = array.array('d', (r.x, r.y, r.w, r.h))
+        self.n_walls = len(rects)
+        self.wall_version += 1
+
+    def update(self, enemies, p_pos, walls):
+        if self.count < self.min_enemies or self.count != len(enemies) or len(walls) > AI_MAX_WALLS:
+            enemies.update(p_pos, walls)
+            return
+        if self.high == 0: return
+
+        # One sync per tick: workers advance their shards in place, then only the rects are refreshed
+        # (Enemy.pos reads the buffer directly)
+        high, n = self.high, AI_MAX_ENEMIES
+        shard = -(-high // self.workers)
+        self.pool.map(_ai_step_shard, [(s, min(s + shard, high), p_pos.x, p_pos.y, self.n_walls, self.wall_version)
+                                       for s in range(0, high, shard)])
+
+        xs, ys = self.e[:high].tolist(), self.e[n:n + high].tolist()
+        for en, x, y in zip(self.owners[:high], xs, ys):
+            if en: en.rect.center = (x, y)
+
+    def close(self):
+        if self.pool:
+            self.pool.terminate()
+            self.pool.join()
+        for view in [self.e, self.w]:
+            if view: view.release()
+        for shm in [self.enemy_shm, self.wall_shm]:
+            if shm:
+                shm.close()
+                shm.unlink()
+        self.enemy_shm = self.wall_shm = self.e = self.w = self.pool = None
+
+
 # --- Core Game Logic ---
 class Game:
     def __init__(self):
+        self.ai = None
+
         pygame.init()
         pygame.mixer.init()
         pygame.joystick.init()
@@ -155,6 +312,11 @@ class Game:
         self.reset_game()
         self.init_buttons()
 
+        # Created last so a failure above can't leave workers or shared memory behind
+        if AI_WORKERS > 0:
+            self.ai = ParallelEnemyAI(AI_WORKERS)
+            self.ai.load_walls(self.walls)
+
     def apply_sound_volumes(self):
         sounds = [self.snd_shoot, self.snd_explode, self.snd_hit, self.snd_heal, self.snd_powerup]
         for s in sounds: s.set_volume(self.sound_vol)
@@ -300,6 +462,7 @@ class Game:
             self.transition_timer = 5000
             self.bullets.empty()
             self.enemies.empty()
+            if self.ai: self.ai.reset()
             self.items.empty()
             return
 
@@ -336,7 +499,10 @@ class Game:
                 self.shot_cooldown = shot_rate
 
         self.player.update(move, self.walls, self.WIDTH, self.HEIGHT, aim_angle, self.boost_timers["shield"] > 0)
-        self.enemies.update(self.player.pos, self.walls)
+        if self.ai:
+            self.ai.update(self.enemies, self.player.pos, self.walls)
+        else:
+            self.enemies.update(self.player.pos, self.walls)
         self.bullets.update()
         self.items.update()
 
@@ -488,6 +654,7 @@ class Game:
         self.shot_cooldown = 0
         self.boost_timers = {"speed": 0, "shield": 0}
         self.inventory = {"speed": 0, "shield": 0}
+        if self.ai: self.ai.reset()
         self.gen_maze()
 
     def gen_maze(self):
@@ -496,12 +663,15 @@ class Game:
             w = Wall(random.randint(100, self.WIDTH - 100), random.randint(HEADER_HEIGHT + 100, self.HEIGHT - 100))
             if not w.rect.colliderect(self.player.rect.inflate(300, 300)):
                 self.walls.add(w)
+        if self.ai: self.ai.load_walls(self.walls)
 
     def spawn_enemy(self):
         for _ in range(5):
             x, y = random.randint(50, self.WIDTH - 50), random.randint(HEADER_HEIGHT + 50, self.HEIGHT - 50)
             if not any(w.rect.collidepoint(x, y) for w in self.walls):
-                self.enemies.add(Enemy(x, y, self.is_wave))
+                enemy = Enemy(x, y, self.is_wave)
+                if self.ai: self.ai.attach(enemy)
+                self.enemies.add(enemy)
                 break
 
 
@@ -588,9 +758,24 @@ class Enemy(pygame.sprite.Sprite):
         else:
             pygame.draw.polygon(self.image, self.color, [(20, 0), (38, 10), (38, 30), (20, 40), (2, 30), (2, 10)], 2)
         self.rect = self.image.get_rect(center=(x, y))
+        self.ai, self.slot = None, None
         self.pos = pygame.Vector2(self.rect.center)
         self.speed = (2.0 if self.wave else 1.5)
 
+    @property
+    def pos(self):
+        # While attached to ParallelEnemyAI the position lives in its shared buffer
+        return self.ai.get_pos(self.slot) if self.ai else self._pos
+
+    @pos.setter
+    def pos(self, value):
+        self._pos = pygame.Vector2(value)
+        if self.ai: self.ai.set_pos(self.slot, self._pos)
+
+    def kill(self):
+        if self.ai: self.ai.release(self)
+        super().kill()
+
     def update(self, p_pos, walls):
         direction = (p_pos - self.pos).normalize()
         self.pos += direction * self.speed
@@ -641,11 +826,15 @@ class Explosion(pygame.sprite.Sprite):
         surf.blit(s, self.pos - pygame.Vector2(self.rad) + off)
 
 
-g = Game()
-g.running = True
-while g.running:
-    if not g.handle_input(): g.running = False
-    g.update()
-    g.draw()
-    g.clock.tick(60)
-pygame.quit()
+if __name__ == "__main__":
+    g = Game()
+    g.running = True
+    try:
+        while g.running:
+            if not g.handle_input(): g.running = False
+            g.update()
+            g.draw()
+            g.clock.tick(60)
+    finally:
+        if g.ai: g.ai.close()
+        pygame.quit()